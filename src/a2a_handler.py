@@ -4,6 +4,13 @@ from dictionary_agent import DictionaryAgent
 
 logger = logging.getLogger(__name__)
 
+_AGENT_INFO_TEMPLATE = {
+    "version": "1.0.0",
+    "capabilities": ["message", "definitions", "examples"],
+    "commands": ["define", "meaning", "help"],
+    "status": "online"
+}
+
 
 class A2AHandler:
     """
@@ -13,6 +20,7 @@ class A2AHandler:
     
     def __init__(self):
         self.agent = DictionaryAgent()
+        self._agent_info = {"name": self.agent.name, **_AGENT_INFO_TEMPLATE}
         logger.info(f"✅ A2A Handler initialized: {self.agent.name}")
     
     async def handle_a2a_message(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -44,7 +52,7 @@ class A2AHandler:
             params = payload.get("params", {})
             request_id = payload.get("id")
             
-            logger.info(f"📨 A2A Request - Method: {method}, ID: {request_id}")
+            logger.debug("📨 A2A Request - Method: %s, ID: %s", method, request_id)
             
             # Handle different methods
             if method == "message":
@@ -89,13 +97,14 @@ class A2AHandler:
                 ""
             )
             
-            user_info = params.get("user", {})
-            channel_info = params.get("channel", {})
-            
-            user_id = user_info.get("id", "unknown") if isinstance(user_info, dict) else str(user_info)
-            channel_id = channel_info.get("id", "unknown") if isinstance(channel_info, dict) else str(channel_info)
-            
-            logger.info(f"📝 Message from user {user_id} in channel {channel_id}: '{message_text}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                user_info = params.get("user", {})
+                channel_info = params.get("channel", {})
+                
+                user_id = user_info.get("id", "unknown") if isinstance(user_info, dict) else str(user_info)
+                channel_id = channel_info.get("id", "unknown") if isinstance(channel_info, dict) else str(channel_info)
+                
+                logger.debug("📝 Message from user %s in channel %s: '%s'", user_id, channel_id, message_text)
             
             if not message_text or len(message_text.strip()) == 0:
                 return self._create_error_response(
@@ -105,9 +114,9 @@ class A2AHandler:
                 )
             
             # Process with dictionary agent
-            bot_response = self.agent.process_message(message_text)
+            bot_response = await self.agent.process_message(message_text)
             
-            logger.info(f"🤖 Generated response ({len(bot_response)} chars): {bot_response[:100]}...")
+            logger.debug("🤖 Generated response (%d chars): %.100s...", len(bot_response), bot_response)
             
             # Return response in multiple formats for compatibility
             result = {
@@ -128,7 +137,7 @@ class A2AHandler:
             
             response = self._create_success_response(request_id, result)
             
-            logger.info(f"✅ Sending response: {str(response)[:200]}...")
+            logger.debug("✅ Sending response: %.200s...", response)
             
             return response
         
@@ -140,16 +149,17 @@ class A2AHandler:
                 f"Error processing message: {str(e)}"
             )
     
-    def _create_success_response(self, request_id: str, result: Any) -> Dict[str, Any]:
-        """Create JSON-RPC success response"""
+    @staticmethod
+    def _create_success_response(request_id: str, result: Any) -> Dict[str, Any]:
+        """Create JSON-RPC success response (hot path: single dict literal)"""
         return {
             "jsonrpc": "2.0",
             "result": result,
             "id": request_id
         }
     
+    @staticmethod
     def _create_error_response(
-        self, 
         request_id: str, 
         code: int, 
         message: str
@@ -166,10 +176,4 @@ class A2AHandler:
     
     def _get_agent_info(self) -> Dict[str, Any]:
         """Return agent information"""
-        return {
-            "name": self.agent.name,
-            "version": "1.0.0",
-            "capabilities": ["message", "definitions", "examples"],
-            "commands": ["define", "meaning", "help"],
-            "status": "online"
-        }
\ No newline at end of file
+        return self._agent_info
\ No newline at end of file
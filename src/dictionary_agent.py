@@ -1,20 +1,13 @@
-import requests
+import httpx
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-class DictionaryAgent:
-    """
-    Smart Dictionary Agent using Free Dictionary API
-    """
-    
-    def __init__(self):
-        self.api_base_url = "https://api.dictionaryapi.dev/api/v2/entries/en"
-        self.name = "SmartDict Bot"
-        self.help_message = """📖 **SmartDict Bot - How to Use**
+_HELP_MESSAGE = """📖 **SmartDict Bot - How to Use**
         
 I can help you look up word definitions! Here's how:
 
@@ -28,6 +21,47 @@ Examples:
 - meaning serendipity
 - eloquent
 """
+
+# Quotes, brackets and sentence punctuation stripped around a word so "love?"
+# or "“ephemeral”." still resolve. Symbols like + # @ - stay put ("C++" is
+# not "c"), a leading "." or apostrophe is kept (".NET", "'tis").
+_LEADING_PUNCTUATION = '"([{“…'
+_TRAILING_PUNCTUATION = '.,!?;:")]}”…\'‘’'
+
+_HELP_TRIGGERS = frozenset({'help', '/help', 'how to use'})
+_GREETINGS = frozenset({'hello', 'hi', 'hey', 'greetings'})
+
+# Optional command prefix followed by the word. Longer prefixes come first
+# so "meaning of x" isn't swallowed by "meaning".
+_WORD_RE = re.compile(
+    r'^(?:(?:definition\s+of|meaning\s+of|what\s+is|whats|define|meaning)[:\s]+)?(\S+)',
+    re.IGNORECASE
+)
+
+
+class DictionaryAgent:
+    """
+    Smart Dictionary Agent using Free Dictionary API
+    """
+    
+    _CACHE_SIZE = 4096
+    _NOT_FOUND_SIZE = 1024
+    
+    def __init__(self):
+        self.api_base_url = "https://api.dictionaryapi.dev/api/v2/entries/en"
+        self.name = "SmartDict Bot"
+        # Shared client so connections are pooled across lookups
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+        # LRU of formatted definitions, keyed on the lowercased word
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        # Recent 404s, so repeated misses don't hit the API again
+        self._not_found: "OrderedDict[str, None]" = OrderedDict()
+        self.help_message = _HELP_MESSAGE
     
     async def process_message(self, message: str) -> str:
         """Process incoming messages"""
@@ -35,11 +69,11 @@ Examples:
         message_lower = message.lower()
         
         # Check for help
-        if message_lower in ['help', '/help', 'how to use']:
+        if message_lower in _HELP_TRIGGERS:
             return self.help_message
         
         # Check for greetings
-        if message_lower in ['hello', 'hi', 'hey', 'greetings']:
+        if message_lower in _GREETINGS:
             return f"👋 Hello! I'm {self.name}. Send me any word or type 'help' to learn how to use me!"
         
         # Extract word
@@ -51,75 +85,100 @@ Examples:
         return await self.lookup_word(word)
     
     def _extract_word(self, message: str) -> Optional[str]:
-        """Extract the word from message"""
-        message_lower = message.lower().strip()
+        """Extract the word from an already stripped message"""
+        match = _WORD_RE.match(message)
+        return match.group(1) if match else None
+    
+    async def lookup_word(self, word: str) -> str:
+        """Look up word in dictionary API"""
+        original = word
+        word = word.lstrip(_LEADING_PUNCTUATION).rstrip(_TRAILING_PUNCTUATION)
+        word = word.replace("’", "'")
+        if not word:
+            return self._not_found_message(original)
         
-        prefixes = ['define ', 'meaning ', 'what is ', 'whats ', 
-                   'definition of ', 'meaning of ', 'define: ', 'meaning: ']
+        word_lower = word.lower()
         
-        for prefix in prefixes:
-            if message_lower.startswith(prefix):
-                word = message[len(prefix):].strip()
-                return word.split()[0] if word else None
+        cached = self._cache.get(word_lower)
+        if cached is not None:
+            self._cache.move_to_end(word_lower)
+            return cached
         
-        words = message.split()
-        if words:
-            return words[0]
+        # Tokens with digits, emoji or inner punctuation will always 404
+        is_word = word_lower.replace("-", "").replace("'", "").isalpha()
+        if not is_word or word_lower in self._not_found:
+            return self._not_found_message(word)
         
-        return None
-    
-    async def lookup_word(self, word: str) -> str:
-        """Look up word in dictionary API"""
         try:
-            url = f"{self.api_base_url}/{word.lower()}"
-            logger.info(f"Looking up: {word}")
+            logger.debug("Looking up: %s", word)
             
-            response = requests.get(url, timeout=10)
+            response = await self._client.get(f"/{word_lower}")
             
             if response.status_code == 404:
-                return f"❌ Sorry, I couldn't find '{word}' in my dictionary. Please check the spelling."
+                self._not_found[word_lower] = None
+                if len(self._not_found) > self._NOT_FOUND_SIZE:
+                    self._not_found.popitem(last=False)
+                return self._not_found_message(word)
             
             if response.status_code != 200:
                 return f"⚠️ I had trouble looking up '{word}'. Please try again later."
             
             data = response.json()
-            return self._format_definition(word, data)
+            formatted = self._format_definition(word, data)
+            
+            if formatted is None:
+                return f"❌ No definition found for '{word}'."
+            
+            # Only real definitions are cached
+            self._cache[word_lower] = formatted
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+            
+            return formatted
         
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return f"⏱️ Request timed out while looking up '{word}'. Please try again."
         
         except Exception as e:
             logger.error(f"Error: {str(e)}")
             return f"❌ An unexpected error occurred. Please try again."
     
-    def _format_definition(self, word: str, data: list) -> str:
-        """Format API response"""
+    def _not_found_message(self, word: str) -> str:
+        """Message for words the dictionary doesn't know"""
+        return f"❌ Sorry, I couldn't find '{word}' in my dictionary. Please check the spelling."
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        await self._client.aclose()
+    
+    def _format_definition(self, word: str, data: list) -> Optional[str]:
+        """Format API response, or None if it holds no usable definition"""
         try:
             if not data:
-                return f"❌ No definition found for '{word}'."
+                return None
 
             entry = data[0]
             meanings = entry.get('meanings', [])
 
-            if not meanings:
-                return f"❌ No meanings found for '{word}'."
-
-            # Build response
-            response = f"📖 {word.upper()}\n\n"
+            # Build response: one block per part of speech
+            blocks = [
+                self._format_meaning(meaning)
+                for meaning in meanings
+                if meaning.get('definitions')
+            ]
 
-            for meaning in meanings:
-                part_of_speech = meaning.get('partOfSpeech', 'unknown')
-                definitions = meaning.get('definitions', [])
+            if not blocks:
+                return None
 
-                if definitions:
-                    response += f"**{part_of_speech}**\n"
-                    for i, definition in enumerate(definitions[:3]):
-                        def_text = definition.get('definition', '')
-                        response += f"- {def_text}\n"
-                    response += "\n"
-
-            return response.strip()
+            return (f"📖 {word.upper()}\n\n" + "\n".join(blocks)).strip()
 
         except Exception as e:
             logger.error(f"Formatting error: {str(e)}")
-            return f"Found definition for '{word}' but had trouble formatting it."
\ No newline at end of file
+            return None
+    
+    def _format_meaning(self, meaning: dict) -> str:
+        """Format one part of speech with up to 3 definitions"""
+        lines = [f"**{meaning.get('partOfSpeech', 'unknown')}**\n"]
+        for definition in meaning['definitions'][:3]:
+            lines.append(f"- {definition.get('definition', '')}\n")
+        return "".join(lines)
\ No newline at end of file
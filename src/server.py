@@ -1,12 +1,16 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from typing import Optional
+import orjson
 import logging
 import sys
 import os
 
 
 PORT = int(os.getenv("PORT", 8000))
+
 # Logging
 
 logging.basicConfig(
@@ -16,18 +20,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Manifest is static, so read it once at import time
+_MANIFEST_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", ".well-known", "agent.json")
+)
+
+def _load_manifest() -> Optional[bytes]:
+    """Read the agent manifest, or None if it is missing"""
+    if not os.path.exists(_MANIFEST_PATH):
+        return None
+    with open(_MANIFEST_PATH, "rb") as manifest:
+        return manifest.read()
+
+_MANIFEST_BYTES = _load_manifest()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the A2A handler once per worker and release its
+    pooled HTTP connections on shutdown
+    """
+    global a2a_handler
+    a2a_handler = A2AHandler()
+    yield
+    await a2a_handler.agent.close()
+
 # Create FastAPI app
 app = FastAPI(
     title="SmartDict Bot - Telex A2A Agent",
     description="Dictionary agent using A2A Protocol",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Import A2A handler
 from a2a_handler import A2AHandler
 
-# Initialize
-a2a_handler = A2AHandler()
+# Initialized in lifespan so each served app builds exactly one
+a2a_handler: Optional[A2AHandler] = None
 
 # Serve agent.json manifest
 @app.get("/.well-known/agent.json")
@@ -36,12 +66,10 @@ async def agent_manifest():
     Serve the agent manifest file
     This is REQUIRED for Telex to discover your agent
     """
-    manifest_path = os.path.join(os.path.dirname(__file__), "..", ".well-known", "agent.json")
-    
-    if os.path.exists(manifest_path):
-        return FileResponse(manifest_path, media_type="application/json")
-    else:
+    if _MANIFEST_BYTES is None:
         raise HTTPException(status_code=404, detail="Manifest not found")
+    
+    return Response(content=_MANIFEST_BYTES, media_type="application/json")
 
 @app.get("/")
 async def root():
@@ -81,52 +109,57 @@ async def a2a_webhook(request: Request):
     try:
         # Log incoming request
         body = await request.body()
-        logger.info(f"📨 A2A Webhook called")
-        logger.debug(f"Raw body: {body.decode('utf-8')}")
+        logger.debug("📨 A2A Webhook called")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw body: %s", body)
         
-        # Parse JSON-RPC payload
-        payload = await request.json()
-        logger.info(f"📦 Payload: {payload}")
+        # Parse JSON-RPC payload (reuse the bytes already read)
+        payload = orjson.loads(body)
+        logger.debug("📦 Payload: %s", payload)
         
         # Process with A2A handler
         response = await a2a_handler.handle_a2a_message(payload)
         
-        logger.info(f"📤 Response: {response}")
+        logger.debug("📤 Response: %s", response)
         
-        return JSONResponse(content=response)
+        return Response(content=orjson.dumps(response), media_type="application/json")
     
     except Exception as e:
         logger.error(f"❌ Webhook error: {str(e)}", exc_info=True)
         
         # Return JSON-RPC error
-        return JSONResponse(
+        return Response(
             status_code=500,
-            content={
+            content=orjson.dumps({
                 "jsonrpc": "2.0",
                 "error": {
                     "code": -32603,
                     "message": f"Internal server error: {str(e)}"
                 },
                 "id": None
-            }
+            }),
+            media_type="application/json"
         )
 
 @app.post("/test")
 async def test_agent(request: Request):
     """Test endpoint for local testing"""
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
         message = data.get("message", "")
         
-        response = a2a_handler.agent.process_message(message)
+        response = await a2a_handler.agent.process_message(message)
         
-        return {
-            "input": message,
-            "output": response
-        }
+        return Response(
+            content=orjson.dumps({
+                "input": message,
+                "output": response
+            }),
+            media_type="application/json"
+        )
     
     except Exception as e:
-        return {"error": str(e)}
+        return Response(content=orjson.dumps({"error": str(e)}), media_type="application/json")
 
 # Run server
 if __name__ == "__main__":
@@ -136,9 +169,15 @@ if __name__ == "__main__":
     
     logger.info(f"🚀 Starting SmartDict Bot (A2A Protocol) on port {port}")
     
+    # Each worker builds its own A2AHandler (and caches) in lifespan;
+    # set WEB_CONCURRENCY to size this for the host
+    workers = int(os.getenv("WEB_CONCURRENCY", 2))
+    
     uvicorn.run(
-        app,
+        "server:app",
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        workers=workers,
+        log_level="info",
+        access_log=False
     )
\ No newline at end of file